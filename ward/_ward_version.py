@@ -1,3 +1,8 @@
-import pkg_resources
+try:
+    from importlib.metadata import version
+except ImportError:  # Python < 3.8
+    from pkg_resources import get_distribution
 
-__version__ = pkg_resources.get_distribution("ward").version
+    __version__ = get_distribution("ward").version
+else:
+    __version__ = version("ward")
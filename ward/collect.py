@@ -3,6 +3,7 @@ import importlib.util
 import inspect
 import os
 import pkgutil
+import re
 from distutils.sysconfig import get_python_lib
 from importlib._bootstrap import ModuleSpec
 from importlib._bootstrap_external import FileFinder
@@ -23,7 +24,6 @@ from typing import (
 from cucumber_tag_expressions.model import Expression
 
 from ward.errors import CollectionError
-from ward.models import WardMeta
 from ward.testing import Test, anonymous_tests, is_test_module_name
 from ward.fixtures import Fixture
 from ward.util import get_absolute_path
@@ -120,24 +120,33 @@ def load_modules(modules: Iterable[pkgutil.ModuleInfo]) -> Generator[Any, None,
             yield m
 
 
-def get_tests_in_modules(
-    modules: Iterable, capture_output: bool = True
-) -> Generator[Test, None, None]:
-    for mod in modules:
-        mod_name = mod.__name__
-        mod_path = get_absolute_path(mod)
-        anon_tests: List[Callable] = anonymous_tests[mod_path]
-        if anon_tests:
-            for test_fn in anon_tests:
-                meta: WardMeta = getattr(test_fn, "ward_meta")
-                yield Test(
-                    fn=test_fn,
-                    module_name=mod_name,
-                    marker=meta.marker,
-                    description=meta.description or "",
-                    capture_output=capture_output,
-                    tags=meta.tags or [],
-                )
+def get_tests_in_modules(modules: Iterable, capture_output: bool = True) -> List[Test]:
+    return [
+        Test(
+            fn=test_fn,
+            module_name=mod.__name__,
+            marker=test_fn.ward_meta.marker,
+            description=test_fn.ward_meta.description or "",
+            capture_output=capture_output,
+            tags=test_fn.ward_meta.tags or [],
+        )
+        for mod in modules
+        for test_fn in anonymous_tests.get(get_absolute_path(mod), [])
+    ]
+
+
+def make_query_matcher(query: str) -> Callable[[str], bool]:
+    """
+    Returns a function which checks whether a string matches the search
+    query. A query starting with "/" is treated as a regular expression
+    to search for, and any other query as a plain substring.
+
+    Raises `re.error` if the query is an invalid regular expression.
+    """
+    if query.startswith("/"):
+        pattern = re.compile(query[1:])
+        return lambda s: pattern.search(s) is not None
+    return lambda s: query in s
 
 
 def filter_tests(
@@ -145,16 +154,18 @@ def filter_tests(
 ) -> Iterator[Test]:
     if not query and not tag_expr:
         yield from tests
+        return
 
+    matches = make_query_matcher(query) if query else None
     for test in tests:
         description = test.description or ""
 
         matches_query = (
             not query
-            or query in description
-            or query in f"{test.module_name}."
-            or query in inspect.getsource(test.fn)
-            or query in test.qualified_name
+            or matches(description)
+            or matches(f"{test.module_name}.")
+            or matches(inspect.getsource(test.fn))
+            or matches(test.qualified_name)
         )
 
         matches_tags = not tag_expr or tag_expr.evaluate(test.tags)
@@ -172,12 +183,13 @@ def filter_fixtures(
         paths = []
     paths = {path.absolute() for path in paths}
 
+    matches = make_query_matcher(query) if query else None
     for fixture in fixtures:
         matches_query = (
             not query
-            or query in f"{fixture.module_name}."
-            or query in inspect.getsource(fixture.fn)
-            or query in fixture.qualified_name
+            or matches(f"{fixture.module_name}.")
+            or matches(inspect.getsource(fixture.fn))
+            or matches(fixture.qualified_name)
         )
 
         matches_paths = (
@@ -59,6 +59,20 @@ class TestFailure(Exception):
         self.operator = operator
         self.assert_msg = assert_msg
 
+    def __reduce__(self):
+        # The default reduction only passes `args` back to __init__,
+        # which doesn't include our keyword arguments. `args` is restored
+        # along with the other attributes so that str() is unchanged.
+        init_args = (
+            self.message,
+            self.lhs,
+            self.rhs,
+            self.error_line,
+            self.operator,
+            self.assert_msg,
+        )
+        return self.__class__, init_args, {**self.__dict__, "args": self.args}
+
 
 def assert_equal(lhs_val, rhs_val, assert_msg):
     if lhs_val != rhs_val:
@@ -21,9 +21,12 @@ from typing import (
 
 from dataclasses import dataclass, field
 
+from ward.errors import FixtureError
 from ward.models import WardMeta, Scope
+from ward.util import add_slots, get_line_number
 
 
+@add_slots
 @dataclass
 class Fixture:
     fn: Callable
@@ -69,7 +72,7 @@ class Fixture:
 
     @property
     def line_number(self) -> int:
-        return inspect.getsourcelines(self.fn)[1]
+        return get_line_number(self.fn)
 
     @property
     def is_generator_fixture(self):
@@ -84,7 +87,7 @@ class Fixture:
         return inspect.iscoroutinefunction(inspect.unwrap(self.fn))
 
     def deps(self):
-        return inspect.signature(self.fn).parameters
+        return _get_fixture_meta(self.fn).deps
 
     def parents(self) -> List["Fixture"]:
         """
@@ -109,6 +112,52 @@ ScopeKey = Union[TestId, Path, Scope]
 ScopeCache = Dict[Scope, Dict[ScopeKey, Dict[FixtureKey, Fixture]]]
 
 
+# Signatures depend only on the function object, so they're computed
+# once per function rather than on every access.
+_SIG_CACHE: Dict[Callable, inspect.Signature] = {}
+
+
+def _get_signature(fn: Callable) -> inspect.Signature:
+    signature = _SIG_CACHE.get(fn)
+    if signature is None:
+        # Prefer the signature captured by @test or @fixture, if present.
+        meta = getattr(fn, "ward_meta", None)
+        signature = getattr(meta, "signature", None) or inspect.signature(fn)
+        _SIG_CACHE[fn] = signature
+    return signature
+
+
+@dataclass(frozen=True)
+class _FixtureMeta:
+    """
+    The parts of a `Fixture` required to look it up in a `FixtureCache`
+    and to resolve its dependencies. These only depend on the fixture
+    function, so they're computed once per function.
+    """
+
+    key: FixtureKey
+    scope: Scope
+    deps: Mapping[str, inspect.Parameter]
+
+
+_FIXTURE_META_CACHE: Dict[Callable, _FixtureMeta] = {}
+
+
+def _get_fixture_meta(fn: Callable) -> _FixtureMeta:
+    meta = _FIXTURE_META_CACHE.get(fn)
+    if meta is None:
+        fixture = Fixture(fn)
+        meta = _FIXTURE_META_CACHE.setdefault(
+            fn,
+            _FixtureMeta(
+                key=fixture.key,
+                scope=fixture.scope,
+                deps=_get_signature(fn).parameters,
+            ),
+        )
+    return meta
+
+
 def _scope_cache_factory():
     return {scope: {} for scope in Scope}
 
@@ -130,9 +179,13 @@ class FixtureCache:
         e.g. has a module-scoped fixture been cached for the current test module?
 
     The final lookup lets us retrieve the actual fixture given a fixture key.
+
+    Global fixtures are also indexed by their fixture function, which lets
+    them be found with a single lookup (see `get_global_by_fn`).
     """
 
     _scope_cache: ScopeCache = field(default_factory=_scope_cache_factory)
+    _global_fixtures_by_fn: Dict[Callable, Fixture] = field(default_factory=dict)
 
     def _get_subcache(self, scope: Scope) -> Dict[str, Any]:
         return self._scope_cache[scope]
@@ -151,14 +204,32 @@ class FixtureCache:
         """
         fixtures = self.get_fixtures_at_scope(fixture.scope, scope_key)
         fixtures[fixture.key] = fixture
+        if fixture.scope == Scope.Global:
+            self._global_fixtures_by_fn[fixture.fn] = fixture
 
     def teardown_fixtures_for_scope(self, scope: Scope, scope_key: ScopeKey):
+        """
+        Tear down every fixture cached at the given scope. If a fixture's
+        teardown raises, the remaining fixtures are still torn down, and then
+        a `FixtureError` is raised from the first error.
+        """
         fixture_dict = self.get_fixtures_at_scope(scope, scope_key)
         fixtures = list(fixture_dict.values())
+        failure = None
         for fixture in fixtures:
-            with suppress(RuntimeError, StopIteration):
-                fixture.teardown()
+            try:
+                with suppress(RuntimeError, StopIteration):
+                    fixture.teardown()
+            except (Exception, SystemExit) as e:
+                if failure is None:
+                    failure = fixture, e
             del fixture_dict[fixture.key]
+            if scope == Scope.Global:
+                self._global_fixtures_by_fn.pop(fixture.fn, None)
+
+        if failure:
+            fixture, e = failure
+            raise FixtureError(f"Unable to tear down fixture '{fixture.name}'") from e
 
     def teardown_global_fixtures(self):
         self.teardown_fixtures_for_scope(Scope.Global, Scope.Global)
@@ -173,6 +244,13 @@ class FixtureCache:
         fixtures = self.get_fixtures_at_scope(scope, scope_key)
         return fixtures.get(fixture_key)
 
+    def get_global_by_fn(self, fixture_fn: Callable) -> Optional[Fixture]:
+        """
+        Return the cached global fixture for the given fixture function,
+        or None if it isn't a global fixture or hasn't been cached.
+        """
+        return self._global_fixtures_by_fn.get(fixture_fn)
+
 
 _DEFINED_FIXTURES = []
 
@@ -193,6 +271,7 @@ def fixture(func=None, *, scope: Optional[Union[Scope, str]] = Scope.Test):
         func.ward_meta.path = path
     else:
         func.ward_meta = WardMeta(is_fixture=True, scope=scope, path=path)
+    func.ward_meta.signature = inspect.signature(func)
 
     _DEFINED_FIXTURES.append(Fixture(func))
 
@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from inspect import BoundArguments
+from inspect import BoundArguments, Signature
 from pathlib import Path
 from typing import List, Optional
 
@@ -46,3 +46,6 @@ class WardMeta:
     scope: Scope = Scope.Test
     bound_args: Optional[BoundArguments] = None
     path: Optional[Path] = None
+    # Captured when the function is decorated, so that running tests
+    # doesn't have to inspect it again.
+    signature: Optional[Signature] = field(default=None, compare=False, repr=False)
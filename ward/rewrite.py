@@ -1,4 +1,5 @@
 import ast
+import dataclasses
 import inspect
 import textwrap
 import types
@@ -129,8 +130,6 @@ def rewrite_assertion(test: Test) -> Test:
                 test.fn.__defaults__,
             )
             new_test_func.ward_meta = test.fn.ward_meta
-            return Test(
-                **{k: vars(test)[k] for k in vars(test) if k != "fn"}, fn=new_test_func,
-            )
+            return dataclasses.replace(test, fn=new_test_func)
 
     return test
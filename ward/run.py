@@ -1,3 +1,4 @@
+import re
 import sys
 from pathlib import Path
 from timeit import default_timer
@@ -10,18 +11,7 @@ from cucumber_tag_expressions import parse as parse_tags
 from cucumber_tag_expressions.model import Expression
 
 from ward._ward_version import __version__
-from ward.collect import (
-    get_info_for_modules,
-    get_tests_in_modules,
-    load_modules,
-    filter_tests,
-    filter_fixtures,
-)
 from ward.config import set_defaults_from_config
-from ward.rewrite import rewrite_assertions_in_tests
-from ward.suite import Suite
-from ward.fixtures import _DEFINED_FIXTURES
-from ward.terminal import SimpleTestResultWrite, output_fixtures, get_exit_code
 
 init()
 
@@ -65,13 +55,27 @@ exclude = click.option(
 )
 
 
+def validate_search_query(
+    ctx: click.Context, param: click.Parameter, value: Optional[str]
+) -> Optional[str]:
+    from ward.collect import make_query_matcher
+
+    if value:
+        try:
+            make_query_matcher(value)
+        except re.error as e:
+            raise click.BadParameter(f"invalid regular expression: {e}")
+    return value
+
+
 @run.command()
 @config
 @path
 @exclude
 @click.option(
     "--search",
-    help="Search test names, bodies, descriptions and module names for the search query and only keep matching tests.",
+    help="Search test names, bodies, descriptions and module names for the search query and only keep matching tests. Queries starting with '/' are regular expressions.",
+    callback=validate_search_query,
 )
 @click.option(
     "--tags",
@@ -97,6 +101,14 @@ exclude = click.option(
     default="standard",
     help="Specify the order in which tests should run.",
 )
+@click.option(
+    "-n",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Run tests in N processes. Each module runs in a single process, and global fixtures are set up once per process. Only available on platforms where 'fork' is the default multiprocessing start method (e.g. Linux, but not macOS or Windows); elsewhere, tests run in a single process.",
+    metavar="N",
+)
 @click.option(
     "--show-diff-symbols/--hide-diff-symbols",
     default=False,
@@ -131,18 +143,40 @@ def test(
     fail_limit: Optional[int],
     test_output_style: str,
     order: str,
+    workers: int,
     capture_output: bool,
     show_slowest: int,
     show_diff_symbols: bool,
     dry_run: bool,
 ):
     """Run tests."""
+    # Imported here rather than at module level so that commands which
+    # don't collect tests (e.g. --help, --version) start up quickly.
+    from ward.collect import (
+        get_info_for_modules,
+        get_tests_in_modules,
+        load_modules,
+        filter_tests,
+    )
+    from ward.rewrite import rewrite_assertions_in_tests
+    from ward.suite import Suite, _can_fork_workers
+    from ward.terminal import SimpleTestResultWrite
+
+    if workers > 1 and not _can_fork_workers():
+        click.echo(
+            "Warning: --workers is only supported on platforms where 'fork' is "
+            "the default multiprocessing start method, so tests will run in a "
+            "single process.",
+            err=True,
+        )
+        workers = 1
+
     start_run = default_timer()
     paths = [Path(p) for p in path]
     mod_infos = get_info_for_modules(paths, exclude)
-    modules = list(load_modules(mod_infos))
+    modules = load_modules(mod_infos)
     unfiltered_tests = get_tests_in_modules(modules, capture_output)
-    filtered_tests = list(filter_tests(unfiltered_tests, query=search, tag_expr=tags,))
+    filtered_tests = filter_tests(unfiltered_tests, query=search, tag_expr=tags,)
 
     # Rewrite assertions in each test
     tests = rewrite_assertions_in_tests(filtered_tests)
@@ -150,7 +184,9 @@ def test(
     time_to_collect = default_timer() - start_run
 
     suite = Suite(tests=tests)
-    test_results = suite.generate_test_runs(order=order, dry_run=dry_run)
+    test_results = suite.generate_test_runs(
+        order=order, dry_run=dry_run, workers=workers
+    )
 
     writer = SimpleTestResultWrite(
         suite=suite,
@@ -161,9 +197,7 @@ def test(
     writer.output_header(time_to_collect=time_to_collect)
     results = writer.output_all_test_results(test_results, fail_limit=fail_limit)
     time_taken = default_timer() - start_run
-    writer.output_test_result_summary(results, time_taken, show_slowest)
-
-    exit_code = get_exit_code(results)
+    exit_code = writer.output_test_result_summary(results, time_taken, show_slowest)
 
     sys.exit(exit_code.value)
 
@@ -181,7 +215,8 @@ def test(
 )
 @click.option(
     "--search",
-    help="Search fixtures names, bodies, and module names for the search query and only keep matching fixtures.",
+    help="Search fixtures names, bodies, and module names for the search query and only keep matching fixtures. Queries starting with '/' are regular expressions.",
+    callback=validate_search_query,
 )
 @click.option(
     "--show-scopes/--no-show-scopes",
@@ -224,10 +259,19 @@ def fixtures(
     full: bool,
 ):
     """Show information on fixtures."""
+    from ward.collect import (
+        get_info_for_modules,
+        get_tests_in_modules,
+        load_modules,
+        filter_fixtures,
+    )
+    from ward.fixtures import _DEFINED_FIXTURES
+    from ward.terminal import output_fixtures
+
     paths = [Path(p) for p in path]
     mod_infos = get_info_for_modules(paths, exclude)
-    modules = list(load_modules(mod_infos))
-    tests = list(get_tests_in_modules(modules, capture_output=True))
+    modules = load_modules(mod_infos)
+    tests = get_tests_in_modules(modules, capture_output=True)
 
     filtered_fixtures = list(
         filter_fixtures(_DEFINED_FIXTURES, query=search, paths=fixture_path)
@@ -1,12 +1,22 @@
-from collections import defaultdict
+import multiprocessing
+import pickle
+import traceback
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
 from random import shuffle
-from typing import Generator, List
+from typing import Callable, Dict, Generator, List, Optional, Set, Tuple
 
 from ward import Scope
-from ward.errors import ParameterisationError
-from ward.fixtures import FixtureCache
-from ward.testing import Test, TestResult
+from ward.errors import FixtureError, ParameterisationError
+from ward.fixtures import FixtureCache, ScopeKey
+from ward.testing import Test, TestOutcome, TestResult, Timer
+
+
+# A test run by a worker: its index in the Suite, and its index within its
+# parameterised group if it's a generated instance.
+_TestKey = Tuple[int, Optional[int]]
 
 
 @dataclass
@@ -18,42 +28,391 @@ class Suite:
     def num_tests(self):
         return len(self.tests)
 
-    def _test_counts_per_module(self):
-        module_paths = [test.path for test in self.tests]
-        counts = defaultdict(int)
-        for path in module_paths:
-            counts[path] += 1
-        return counts
+    def _test_paths(self) -> List[Path]:
+        return [test.path for test in self.tests]
 
     def generate_test_runs(
-        self, order="standard", dry_run=False
+        self, order="standard", dry_run=False, workers=1
     ) -> Generator[TestResult, None, None]:
         """
         Run tests
 
         Returns a generator which yields test results
+
+        If `workers` is greater than 1, the tests are split by module across
+        that many worker processes (see `_generate_test_runs_in_workers`).
+        Tests run serially on platforms where forking isn't the default start
+        method for processes (e.g. macOS and Windows).
         """
+        if workers > 1 and _can_fork_workers():
+            yield from self._generate_test_runs_in_workers(order, dry_run, workers)
+            return
 
         if order == "random":
             shuffle(self.tests)
 
-        num_tests_per_module = self._test_counts_per_module()
-        for test in self.tests:
-            num_tests_per_module[test.path] -= 1
+        yield from self._run_tests(dry_run)
+
+    def _run_tests(
+        self,
+        dry_run: bool,
+        on_test_start: Optional[Callable[[int, Test], None]] = None,
+    ) -> Generator[TestResult, None, None]:
+        """
+        Run the tests in the order they appear in `self.tests`.
+
+        If given, `on_test_start` is called just before each test is run,
+        with the position in `self.tests` of the test being run, and the
+        `Test` about to run (the test itself, or one of its parameterised
+        instances).
+        """
+        # Look up each test's module once, in step with self.tests.
+        paths = self._test_paths()
+        num_tests_per_module = Counter(paths)
+        # Each result is held back until the fixtures due to be torn down
+        # after its test have been, so a teardown error can fail that result.
+        result = None
+        for position, (test, path) in enumerate(zip(self.tests, paths)):
+            num_tests_per_module[path] -= 1
             try:
                 generated_tests = test.get_parameterised_instances()
             except ParameterisationError as e:
-                yield test.fail_with_error(e)
-                continue
+                if result:
+                    yield result
+                result = test.fail_with_error(e)
+                generated_tests = []
             for generated_test in generated_tests:
-                yield generated_test.run(self.cache, dry_run=dry_run)
-                self.cache.teardown_fixtures_for_scope(
-                    Scope.Test, scope_key=generated_test.id
+                if result:
+                    yield result
+                if on_test_start:
+                    on_test_start(position, generated_test)
+                result = generated_test.run(self.cache, dry_run=dry_run)
+                result = self._teardown_fixtures(Scope.Test, generated_test.id, result)
+
+            if num_tests_per_module[path] == 0:
+                result = self._teardown_fixtures(Scope.Module, path, result)
+
+        result = self._teardown_fixtures(Scope.Global, Scope.Global, result)
+        if result:
+            yield result
+
+    def _teardown_fixtures(
+        self, scope: Scope, scope_key: ScopeKey, result: Optional[TestResult]
+    ) -> Optional[TestResult]:
+        """
+        Tear down the fixtures cached at `scope_key`, returning `result`, the
+        result of the last test to run before the teardown. If the teardown
+        fails, and the test hadn't already failed, its result is replaced
+        with a failure carrying the teardown error.
+        """
+        try:
+            self.cache.teardown_fixtures_for_scope(scope, scope_key=scope_key)
+        except FixtureError as e:
+            if result is None:
+                raise
+            if result.outcome != TestOutcome.FAIL:
+                return TestResult(
+                    test=result.test,
+                    outcome=TestOutcome.FAIL,
+                    error=e,
+                    message=str(e),
+                    captured_stdout=result.captured_stdout,
+                    captured_stderr=result.captured_stderr,
+                )
+        return result
+
+    def _generate_test_runs_in_workers(
+        self, order: str, dry_run: bool, workers: int
+    ) -> Generator[TestResult, None, None]:
+        """
+        Run the tests in `workers` forked processes, yielding each result as
+        soon as a worker reports it.
+
+        Tests are grouped by module, and every module is run entirely within
+        a single worker, so module scoped fixtures behave as they do when
+        running serially. Global fixtures are set up and torn down once per
+        worker rather than once per run.
+
+        If a worker exits unexpectedly, or an error escapes it, the test it
+        was running fails with that error, and the tests it hadn't yet
+        started fail as not run.
+        """
+        global _worker_tests
+        parent_tests, _worker_tests = _worker_tests, self.tests
+
+        # Distribute modules between workers, biggest first, always giving
+        # the next module to the worker with the fewest tests so far.
+        indices_by_path = defaultdict(list)
+        for index, path in enumerate(self._test_paths()):
+            indices_by_path[path].append(index)
+        buckets: List[List[int]] = [[] for _ in range(workers)]
+        for indices in sorted(indices_by_path.values(), key=len, reverse=True):
+            min(buckets, key=len).extend(indices)
+        buckets = [bucket for bucket in buckets if bucket]
+
+        context = multiprocessing.get_context("fork")
+        processes: List[multiprocessing.Process] = []
+        workers_by_connection: Dict[Connection, int] = {}
+        # What each worker is running, and which tests and instances it has
+        # started, so we know what to report if it dies.
+        running: Dict[int, Optional[_TestKey]] = {}
+        started: Dict[int, Dict[int, Set[Optional[int]]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        instances_by_index: Dict[int, List[Test]] = {}
+        try:
+            for worker, bucket in enumerate(buckets):
+                reader, writer = context.Pipe(duplex=False)
+                process = context.Process(
+                    target=_run_tests_in_worker,
+                    args=(bucket, order, dry_run, writer),
+                    daemon=True,
+                )
+                process.start()
+                # Only the worker should hold the writing end, so that we
+                # see EOF if it exits without saying it's finished.
+                writer.close()
+                processes.append(process)
+                workers_by_connection[reader] = worker
+
+            while workers_by_connection:
+                for reader in wait(list(workers_by_connection)):
+                    worker = workers_by_connection[reader]
+                    try:
+                        message = reader.recv()
+                    except EOFError:
+                        processes[worker].join()
+                        message = RuntimeError(
+                            "Worker process exited unexpectedly with exit code "
+                            f"{processes[worker].exitcode}"
+                        )
+
+                    if isinstance(message, tuple):
+                        test_index, instance_index = running[worker] = message
+                        started[worker][test_index].add(instance_index)
+                    elif isinstance(message, _WorkerResult):
+                        running[worker] = None
+                        yield message.to_test_result(self.tests, instances_by_index)
+                    else:
+                        del workers_by_connection[reader]
+                        reader.close()
+                        if message is not None:
+                            yield from self._fail_unfinished_tests(
+                                buckets[worker],
+                                running.get(worker),
+                                started[worker],
+                                message,
+                                instances_by_index,
+                            )
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+            for reader in workers_by_connection:
+                reader.close()
+            _worker_tests = parent_tests
+
+    def _fail_unfinished_tests(
+        self,
+        test_indices: List[int],
+        running: Optional[_TestKey],
+        started: Dict[int, Set[Optional[int]]],
+        error: Exception,
+        instances_by_index: Dict[int, List[Test]],
+    ) -> Generator[TestResult, None, None]:
+        """
+        Fail the tests a worker didn't finish because it died with `error`:
+        the test it was running, if any, fails with `error`, and every test
+        or parameterised instance it hadn't started fails as not run.
+        """
+        not_started: List[_TestKey] = []
+        for test_index in test_indices:
+            started_instances = started.get(test_index)
+            if started_instances is None:
+                not_started.append((test_index, None))
+            elif None not in started_instances:
+                instances = _get_instances(self.tests, test_index, instances_by_index)
+                not_started.extend(
+                    (test_index, instance.param_meta.instance_index)
+                    for instance in instances
+                    if instance.param_meta.instance_index not in started_instances
                 )
 
-            if num_tests_per_module[test.path] == 0:
-                self.cache.teardown_fixtures_for_scope(
-                    Scope.Module, scope_key=test.path
+        # An error with no test running is reported on the first test that
+        # wasn't run, if there is one, and otherwise every test has a result.
+        failing = running or next(iter(not_started), None)
+        if failing:
+            yield _worker_failure(self.tests, failing, error).to_test_result(
+                self.tests, instances_by_index
+            )
+
+        not_run = RuntimeError("Not run, because its worker process died")
+        for key in not_started:
+            if key != failing:
+                yield _worker_failure(self.tests, key, not_run).to_test_result(
+                    self.tests, instances_by_index
                 )
 
-        self.cache.teardown_global_fixtures()
+
+def _can_fork_workers() -> bool:
+    # Workers are only forked where that's the platform's default way of
+    # starting processes, as it's unsafe elsewhere (e.g. on macOS).
+    return multiprocessing.get_all_start_methods()[0] == "fork"
+
+
+# The tests of the Suite being run in worker processes. This is set before
+# the workers are forked, so they can refer to tests by index rather than
+# having them pickled, which isn't possible for most test functions.
+_worker_tests: List[Test] = []
+
+
+@dataclass
+class _WorkerResult:
+    """
+    The picklable parts of a `TestResult` produced in a worker process.
+    The `Test` itself is referred to by its index in the `Suite`, along with
+    its index within its parameterised group if it's a generated instance.
+    """
+
+    test_index: int
+    instance_index: Optional[int]
+    outcome: TestOutcome
+    error: Optional[Exception]
+    message: str
+    captured_stdout: str
+    captured_stderr: str
+    description: Optional[str]
+    duration: Optional[float]
+
+    def to_test_result(
+        self, tests: List[Test], instances_by_index: Dict[int, List[Test]]
+    ) -> TestResult:
+        test = tests[self.test_index]
+        if self.instance_index is not None:
+            instances = _get_instances(tests, self.test_index, instances_by_index)
+            test = instances[self.instance_index]
+
+        test.description = self.description
+        if self.duration is not None:
+            test.timer = Timer()
+            test.timer.duration = self.duration
+
+        return TestResult(
+            test=test,
+            outcome=self.outcome,
+            error=self.error,
+            message=self.message,
+            captured_stdout=self.captured_stdout,
+            captured_stderr=self.captured_stderr,
+        )
+
+
+def _get_instances(
+    tests: List[Test], test_index: int, instances_by_index: Dict[int, List[Test]]
+) -> List[Test]:
+    if test_index not in instances_by_index:
+        instances_by_index[test_index] = tests[test_index].get_parameterised_instances()
+    return instances_by_index[test_index]
+
+
+def _worker_failure(
+    tests: List[Test], key: _TestKey, error: Exception
+) -> _WorkerResult:
+    """
+    A failing result for a test that a worker couldn't report on itself.
+    """
+    test_index, instance_index = key
+    return _WorkerResult(
+        test_index=test_index,
+        instance_index=instance_index,
+        outcome=TestOutcome.FAIL,
+        error=error,
+        message=str(error),
+        captured_stdout="",
+        captured_stderr="",
+        description=tests[test_index].description,
+        duration=0.0,
+    )
+
+
+def _run_tests_in_worker(
+    test_indices: List[int], order: str, dry_run: bool, connection: Connection
+):
+    """
+    Run the given tests, sending down the connection:
+
+    - `(test_index, instance_index)` just before each test is run,
+    - a `_WorkerResult` once each test's result is known,
+    - `None` once all of the tests have been run, or, if an error
+      escapes, the error.
+    """
+    # Workers are daemonic so that they're killed if Ward exits, but daemonic
+    # processes can't have children, and a test may run a Suite with workers.
+    multiprocessing.current_process().daemon = False
+
+    if order == "random":
+        shuffle(test_indices)
+    tests = [_worker_tests[index] for index in test_indices]
+    # Results are matched to tests by identity, not by function, as
+    # different tests can share a function.
+    template_indices = {id(test): index for index, test in zip(test_indices, tests)}
+    running: Optional[_TestKey] = None
+
+    def on_test_start(position: int, test: Test):
+        nonlocal running
+        is_instance = test is not tests[position]
+        running = (
+            test_indices[position],
+            test.param_meta.instance_index if is_instance else None,
+        )
+        connection.send(running)
+
+    try:
+        suite = Suite(tests=tests)
+        for result in suite._run_tests(dry_run, on_test_start):
+            if id(result.test) in template_indices:
+                test_index, instance_index = template_indices[id(result.test)], None
+            else:
+                # Only the instance that was last started can have finished
+                test_index, instance_index = running
+            connection.send(
+                _WorkerResult(
+                    test_index=test_index,
+                    instance_index=instance_index,
+                    outcome=result.outcome,
+                    error=_picklable_error(result.error),
+                    message=result.message,
+                    captured_stdout=result.captured_stdout,
+                    captured_stderr=result.captured_stderr,
+                    description=result.test.description,
+                    duration=result.test.timer.duration if result.test.timer else None,
+                )
+            )
+    except (Exception, SystemExit) as e:
+        connection.send(_picklable_error(e))
+    else:
+        connection.send(None)
+    connection.close()
+
+
+def _picklable_error(error: Optional[Exception]) -> Optional[Exception]:
+    """
+    Tracebacks are lost when exceptions are pickled, so keep a formatted
+    copy on the exception. If the exception itself can't be pickled (e.g.
+    it refers to an unpicklable object), replace it with a plain Exception
+    carrying the same message and traceback.
+    """
+    if error is None:
+        return None
+
+    error.formatted_traceback = traceback.format_exception(
+        type(error), error, error.__traceback__
+    )
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:
+        replacement = Exception(str(error))
+        replacement.formatted_traceback = error.formatted_traceback
+        return replacement
+    return error
@@ -318,7 +318,10 @@ class TestResultWriterBase:
 
     def output_test_result_summary(
         self, test_results: List[TestResult], time_taken: float, duration: int
-    ):
+    ) -> "ExitCode":
+        """
+        Print a summary of the outcomes of the run, returning the exit code.
+        """
         raise NotImplementedError()
 
     def output_why_test_failed(self, test_result: TestResult):
@@ -428,6 +431,11 @@ class SimpleTestResultWrite(TestResultWriterBase):
         trace = getattr(err, "__traceback__", "")
         if trace:
             trc = traceback.format_exception(None, err, trace)
+        else:
+            # Errors from worker processes lose their traceback when
+            # they're pickled, but carry a formatted copy of it instead.
+            trc = getattr(err, "formatted_traceback", None)
+        if trc:
             for line in trc:
                 sublines = line.split("\n")
                 for subline in sublines:
@@ -448,7 +456,7 @@ class SimpleTestResultWrite(TestResultWriterBase):
 
     def output_test_result_summary(
         self, test_results: List[TestResult], time_taken: float, show_slowest: int
-    ):
+    ) -> "ExitCode":
         if show_slowest:
             self._output_slowest_tests(test_results, show_slowest)
         outcome_counts = self._get_outcome_counts(test_results)
@@ -480,6 +488,7 @@ class SimpleTestResultWrite(TestResultWriterBase):
             output += " ] "
 
         print(output)
+        return exit_code
 
     def _output_slowest_tests(self, test_results: List[TestResult], num_tests: int):
         test_results = sorted(
@@ -532,26 +541,10 @@ class SimpleTestResultWrite(TestResultWriterBase):
     def _get_outcome_counts(
         self, test_results: List[TestResult]
     ) -> Dict[TestOutcome, int]:
-        return {
-            TestOutcome.PASS: len(
-                [r for r in test_results if r.outcome == TestOutcome.PASS]
-            ),
-            TestOutcome.FAIL: len(
-                [r for r in test_results if r.outcome == TestOutcome.FAIL]
-            ),
-            TestOutcome.SKIP: len(
-                [r for r in test_results if r.outcome == TestOutcome.SKIP]
-            ),
-            TestOutcome.XFAIL: len(
-                [r for r in test_results if r.outcome == TestOutcome.XFAIL]
-            ),
-            TestOutcome.XPASS: len(
-                [r for r in test_results if r.outcome == TestOutcome.XPASS]
-            ),
-            TestOutcome.DRYRUN: len(
-                [r for r in test_results if r.outcome == TestOutcome.DRYRUN]
-            ),
-        }
+        counts = {outcome: 0 for outcome in TestOutcome}
+        for result in test_results:
+            counts[result.outcome] += 1
+        return counts
 
 
 def outcome_to_colour(outcome: TestOutcome) -> str:
@@ -734,13 +727,11 @@ class ExitCode(Enum):
 
 
 def get_exit_code(results: Iterable[TestResult]) -> ExitCode:
-    if not results:
-        return ExitCode.NO_TESTS_FOUND
-
-    if any(
-        r.outcome == TestOutcome.FAIL or r.outcome == TestOutcome.XPASS for r in results
-    ):
-        exit_code = ExitCode.FAILED
-    else:
+    # A single pass which stops at the first failure, so that this also
+    # works for iterables which can only be consumed once.
+    exit_code = ExitCode.NO_TESTS_FOUND
+    for result in results:
+        if result.outcome == TestOutcome.FAIL or result.outcome == TestOutcome.XPASS:
+            return ExitCode.FAILED
         exit_code = ExitCode.SUCCESS
     return exit_code
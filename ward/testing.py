@@ -2,9 +2,8 @@ import asyncio
 import collections
 import functools
 import inspect
+import itertools
 import traceback
-import uuid
-from collections import defaultdict
 from contextlib import ExitStack, closing, redirect_stderr, redirect_stdout
 from dataclasses import dataclass, field
 from enum import Enum, auto
@@ -26,11 +25,19 @@ from typing import (
 )
 
 from ward.errors import FixtureError, ParameterisationError
-from ward.fixtures import Fixture, FixtureCache, ScopeKey, is_fixture
+from ward.fixtures import (
+    Fixture,
+    FixtureCache,
+    ScopeKey,
+    _get_fixture_meta,
+    _get_signature,
+    is_fixture,
+)
 from ward.models import Marker, Scope, SkipMarker, WardMeta, XfailMarker
-from ward.util import get_absolute_path
+from ward.util import add_slots, get_absolute_path, get_line_number
 
 
+@add_slots
 @dataclass
 class Each:
     args: Tuple[Any]
@@ -47,11 +54,13 @@ def each(*args):
 
 
 def skip(func_or_reason=None, *, reason: str = None):
-    if func_or_reason is None:
-        return functools.partial(skip, reason=reason)
+    if func_or_reason is None or isinstance(func_or_reason, str):
+        reason = reason if func_or_reason is None else func_or_reason
+
+        def _skip_with(func):
+            return skip(func, reason=reason)
 
-    if isinstance(func_or_reason, str):
-        return functools.partial(skip, reason=func_or_reason)
+        return _skip_with
 
     func = func_or_reason
     marker = SkipMarker(reason=reason)
@@ -60,19 +69,17 @@ def skip(func_or_reason=None, *, reason: str = None):
     else:
         func.ward_meta = WardMeta(marker=marker)
 
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
-
-    return wrapper
+    return func
 
 
 def xfail(func_or_reason=None, *, reason: str = None):
-    if func_or_reason is None:
-        return functools.partial(xfail, reason=reason)
+    if func_or_reason is None or isinstance(func_or_reason, str):
+        reason = reason if func_or_reason is None else func_or_reason
 
-    if isinstance(func_or_reason, str):
-        return functools.partial(xfail, reason=func_or_reason)
+        def _xfail_with(func):
+            return xfail(func, reason=reason)
+
+        return _xfail_with
 
     func = func_or_reason
     marker = XfailMarker(reason=reason)
@@ -81,15 +88,105 @@ def xfail(func_or_reason=None, *, reason: str = None):
     else:
         func.ward_meta = WardMeta(marker=marker)
 
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
+    return func
+
+
+# Default arguments depend only on the function object, so they're
+# computed once per function rather than on every access.
+_DEFAULTS_CACHE: Dict[Callable, Dict[str, Any]] = {}
+
+
+def _get_default_args(fn: Callable) -> Dict[str, Any]:
+    """
+    Returns a mapping of the argument names of `fn` to their default values,
+    taking into account any arguments bound using `@using`.
+
+    The returned dict is cached per function and shared between callers,
+    so it must not be mutated.
+    """
+    default_args = _DEFAULTS_CACHE.get(fn)
+    if default_args is not None:
+        return default_args
+
+    meta = getattr(fn, "ward_meta", None)
+
+    # Override the signature if @using is present
+    bound_args = getattr(meta, "bound_args", None) if meta else None
+    if bound_args:
+        bound_args.apply_defaults()
+        default_args = bound_args.arguments
+    else:
+        default_binding = _get_signature(fn).bind_partial()
+        default_binding.apply_defaults()
+        default_args = default_binding.arguments
+
+    _DEFAULTS_CACHE[fn] = default_args
+    return default_args
+
+
+@dataclass(frozen=True)
+class _ParamPlan:
+    """
+    The default arguments of a test function, each tagged with whether it's
+    an `Each`, and the number of instances the test expands into. This only
+    depends on the function, so it's computed once and shared by every
+    instance of a parameterised test.
+
+    `n_instances` is 1 for tests that aren't parameterised, and `None` if the
+    occurrences of `each` in the signature are of different lengths.
+    """
+
+    defaults_items: Tuple[Tuple[str, Any, bool], ...]
+    is_parameterised: bool
+    n_instances: Optional[int]
+
+
+@functools.lru_cache(maxsize=None)
+def _param_plan(fn: Callable) -> _ParamPlan:
+    defaults_items = tuple(
+        (name, arg, isinstance(arg, Each))
+        for name, arg in _get_default_args(fn).items()
+    )
+    lengths = {len(arg) for _, arg, is_each in defaults_items if is_each}
+    n_instances = next(iter(lengths), 1) if len(lengths) <= 1 else None
+    return _ParamPlan(
+        defaults_items=defaults_items,
+        is_parameterised=bool(lengths),
+        n_instances=n_instances,
+    )
 
-    return wrapper
+
+def _fixture_deps(fn: Callable) -> List[Callable]:
+    return [dep for dep in _get_default_args(fn).values() if hasattr(dep, "ward_meta")]
+
+
+@functools.lru_cache(maxsize=None)
+def _resolution_order(fn: Callable) -> Tuple[Callable, ...]:
+    """
+    Returns `fn` along with every fixture it depends on, directly or
+    indirectly, ordered such that each fixture comes after its dependencies.
+    """
+    order: List[Callable] = []
+    visited = set()
+    stack = [(fn, False)]
+    while stack:
+        current, deps_visited = stack.pop()
+        if deps_visited:
+            order.append(current)
+        elif current not in visited:
+            visited.add(current)
+            stack.append((current, True))
+            # Reversed, so that dependencies are popped in declaration order
+            stack.extend((dep, False) for dep in reversed(_fixture_deps(current)))
+    return tuple(order)
+
+
+# Test IDs only need to be unique within a run, so a counter is enough.
+_id_counter = itertools.count()
 
 
 def generate_id():
-    return uuid.uuid4().hex
+    return f"{next(_id_counter):032x}"
 
 
 class FormatDict(dict):
@@ -97,12 +194,14 @@ class FormatDict(dict):
         return "{" + key + "}"
 
 
+@add_slots
 @dataclass
 class ParamMeta:
     instance_index: int = 0
     group_size: int = 1
 
 
+@add_slots
 @dataclass
 class Test:
     """
@@ -121,6 +220,12 @@ class Test:
     ward_meta: WardMeta = field(default_factory=WardMeta)
     timer: Optional["Timer"] = None
     tags: List[str] = field(default_factory=list)
+    _params: Mapping[str, inspect.Parameter] = field(init=False, repr=False)
+    _has_deps: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._params = _get_signature(self.fn).parameters
+        self._has_deps = bool(self._params)
 
     def __hash__(self):
         return hash((self.__class__, self.id))
@@ -216,11 +321,11 @@ class Test:
 
     @property
     def line_number(self) -> int:
-        return inspect.getsourcelines(self.fn)[1]
+        return get_line_number(self.fn)
 
     @property
     def has_deps(self) -> bool:
-        return len(self.deps()) > 0
+        return self._has_deps
 
     @property
     def is_parameterised(self) -> bool:
@@ -229,8 +334,7 @@ class Test:
         A test is considered parameterised if any of its default arguments
         have a value that is an instance of `Each`.
         """
-        default_args = self.resolver._get_default_args()
-        return any(isinstance(arg, Each) for arg in default_args.values())
+        return _param_plan(self.fn).is_parameterised
 
     @property
     def resolver(self):
@@ -258,9 +362,11 @@ class Test:
 
         number_of_instances = self._find_number_of_instances()
 
-        generated_tests = []
-        for instance_index in range(number_of_instances):
-            test = Test(
+        # Instances share this test's function, and so its cached signature
+        # and parameterisation plan, along with its WardMeta. Each gets its
+        # own id, output buffers, ParamMeta and copy of the tags.
+        return [
+            Test(
                 fn=self.fn,
                 module_name=self.module_name,
                 marker=self.marker,
@@ -269,9 +375,11 @@ class Test:
                     instance_index=instance_index, group_size=number_of_instances
                 ),
                 capture_output=self.capture_output,
+                ward_meta=self.ward_meta,
+                tags=list(self.tags),
             )
-            generated_tests.append(test)
-        return generated_tests
+            for instance_index in range(number_of_instances)
+        ]
 
     def _find_number_of_instances(self) -> int:
         """
@@ -282,19 +390,17 @@ class Test:
         an equal number of items. If the current test is an invalid parameterisation,
         then a `ParameterisationError` is raised.
         """
-        default_args = self.resolver._get_default_args()
-        lengths = [len(arg) for _, arg in default_args.items() if isinstance(arg, Each)]
-        is_valid = len(set(lengths)) in (0, 1)
-        if not is_valid:
+        n_instances = _param_plan(self.fn).n_instances
+        if n_instances is None:
             raise ParameterisationError(
                 f"The test {self.name}/{self.description} is parameterised incorrectly. "
                 f"Please ensure all instances of 'each' in the test signature "
                 f"are of equal length."
             )
-        return lengths[0]
+        return n_instances
 
     def deps(self) -> MappingProxyType:
-        return inspect.signature(self.fn).parameters
+        return self._params
 
     def format_description(self, args: Dict[str, Any]) -> str:
         """
@@ -341,24 +447,20 @@ class TestArgumentResolver:
         resolved_args: Dict[str, Any] = {}
         for name, arg in args_for_iteration.items():
             if is_fixture(arg):
-                resolved = self._resolve_single_arg(arg, cache)
+                resolved_args[name] = self._resolve_single_arg(arg, cache).resolved_val
             else:
-                resolved = arg
-            resolved_args[name] = resolved
-        return self._unpack_resolved(resolved_args)
+                resolved_args[name] = arg
+        return resolved_args
 
     def _get_args_for_iteration(self):
         if not self.test.has_deps:
             return {}
-        default_args = self._get_default_args()
-        args_for_iteration: Dict[str, Any] = {}
-        for name, arg in default_args.items():
-            # In the case of parameterised testing, grab the arg corresponding
-            # to the current iteration of the parameterised group of tests.
-            if isinstance(arg, Each):
-                arg = arg[self.iteration]
-            args_for_iteration[name] = arg
-        return args_for_iteration
+        # In the case of parameterised testing, grab the arg corresponding
+        # to the current iteration of the parameterised group of tests.
+        return {
+            name: arg[self.iteration] if is_each else arg
+            for name, arg, is_each in _param_plan(self.test.fn).defaults_items
+        }
 
     @property
     def fixtures(self) -> Dict[str, Fixture]:
@@ -379,20 +481,7 @@ class TestArgumentResolver:
         If a value is a fixture function, then the raw fixture
         function is returned as a value in the dict, *not* the `Fixture` object.
         """
-        fn = func or self.test.fn
-        meta = getattr(fn, "ward_meta", None)
-        signature = inspect.signature(fn)
-
-        # Override the signature if @using is present
-        if meta:
-            bound_args = getattr(fn.ward_meta, "bound_args", None)
-            if bound_args:
-                bound_args.apply_defaults()
-                return bound_args.arguments
-
-        default_binding = signature.bind_partial()
-        default_binding.apply_defaults()
-        return default_binding.arguments
+        return _get_default_args(func or self.test.fn)
 
     def _resolve_single_arg(
         self, arg: Callable, cache: FixtureCache
@@ -407,76 +496,65 @@ class TestArgumentResolver:
         if not hasattr(arg, "ward_meta"):
             return arg
 
-        fixture = Fixture(arg)
-        if cache.contains(
-            fixture, fixture.scope, self.test.scope_key_from(fixture.scope)
-        ):
-            return cache.get(
-                fixture.key, fixture.scope, self.test.scope_key_from(fixture.scope)
-            )
+        # Walk from `arg` towards its dependencies, checking which fixtures
+        # are already cached. The dependencies of a cached fixture don't need
+        # to be resolved, so only those of uncached fixtures are required.
+        order = _resolution_order(arg)
+        resolved: Dict[Callable, Fixture] = {}
+        required = {arg}
+        for fn in reversed(order):
+            if fn not in required:
+                continue
+            cached_fixture = cache.get_global_by_fn(fn)
+            if cached_fixture is None:
+                meta = _get_fixture_meta(fn)
+                scope_key = self.test.scope_key_from(meta.scope)
+                cached_fixture = cache.get(meta.key, meta.scope, scope_key)
+            if cached_fixture is not None:
+                resolved[fn] = cached_fixture
+            else:
+                required.update(_fixture_deps(fn))
 
-        has_deps = len(fixture.deps()) > 0
-        if not has_deps:
-            try:
-                if fixture.is_generator_fixture:
-                    fixture.gen = arg()
-                    fixture.resolved_val = next(fixture.gen)
-                elif fixture.is_async_generator_fixture:
-                    fixture.gen = arg()
-                    awaitable = fixture.gen.__anext__()
-                    fixture.resolved_val = asyncio.get_event_loop().run_until_complete(
-                        awaitable
-                    )
-                elif fixture.is_coroutine_fixture:
-                    fixture.resolved_val = asyncio.get_event_loop().run_until_complete(
-                        arg()
-                    )
-                else:
-                    fixture.resolved_val = arg()
-            except (Exception, SystemExit) as e:
-                raise FixtureError(f"Unable to resolve fixture '{fixture.name}'") from e
-            scope_key = self.test.scope_key_from(fixture.scope)
-            cache.cache_fixture(fixture, scope_key)
-            return fixture
+        # Resolve the required fixtures, dependencies first.
+        for fn in order:
+            if fn in required and fn not in resolved:
+                resolved[fn] = self._resolve_fixture(fn, resolved, cache)
 
-        children_defaults = self._get_default_args(func=arg)
-        children_resolved = {}
-        for name, child_fixture in children_defaults.items():
-            child_resolved = self._resolve_single_arg(child_fixture, cache)
-            children_resolved[name] = child_resolved
+        return resolved[arg]
 
+    def _resolve_fixture(
+        self, fn: Callable, resolved: Dict[Callable, Fixture], cache: FixtureCache
+    ) -> Fixture:
+        """
+        Call the fixture function `fn`, injecting the values of its
+        dependencies from `resolved`, and cache the resulting `Fixture`.
+        """
+        fixture = Fixture(fn)
+        args_to_inject = {
+            name: resolved[dep].resolved_val if hasattr(dep, "ward_meta") else dep
+            for name, dep in _get_default_args(fn).items()
+        }
         try:
-            args_to_inject = self._unpack_resolved(children_resolved)
             if fixture.is_generator_fixture:
-                fixture.gen = arg(**args_to_inject)
+                fixture.gen = fn(**args_to_inject)
                 fixture.resolved_val = next(fixture.gen)
             elif fixture.is_async_generator_fixture:
-                fixture.gen = arg(**args_to_inject)
+                fixture.gen = fn(**args_to_inject)
                 awaitable = fixture.gen.__anext__()
                 fixture.resolved_val = asyncio.get_event_loop().run_until_complete(
                     awaitable
                 )
             elif fixture.is_coroutine_fixture:
                 fixture.resolved_val = asyncio.get_event_loop().run_until_complete(
-                    arg(**args_to_inject)
+                    fn(**args_to_inject)
                 )
             else:
-                fixture.resolved_val = arg(**args_to_inject)
+                fixture.resolved_val = fn(**args_to_inject)
         except (Exception, SystemExit) as e:
             raise FixtureError(f"Unable to resolve fixture '{fixture.name}'") from e
-        scope_key = self.test.scope_key_from(fixture.scope)
-        cache.cache_fixture(fixture, scope_key)
+        cache.cache_fixture(fixture, self.test.scope_key_from(fixture.scope))
         return fixture
 
-    def _unpack_resolved(self, fixture_dict: Dict[str, Any]) -> Dict[str, Any]:
-        resolved_vals = {}
-        for (k, arg) in fixture_dict.items():
-            if isinstance(arg, Fixture):
-                resolved_vals[k] = arg.resolved_val
-            else:
-                resolved_vals[k] = arg
-        return resolved_vals
-
 
 def fixtures_used_directly_by_tests(
     tests: Iterable[Test],
@@ -501,7 +579,7 @@ def is_test_module_name(module_name: str) -> bool:
 # clashes. When we're later looking for tests inside the module,
 # we can retrieve any anonymous tests from this dict.
 # Map of module absolute Path to list of tests in the module
-anonymous_tests: Dict[Path, List[Callable]] = defaultdict(list)
+anonymous_tests: Dict[Path, List[Callable]] = {}
 
 
 def test(description: str, *args, tags=None, **kwargs):
@@ -524,15 +602,10 @@ def test(description: str, *args, tags=None, **kwargs):
                 unwrapped.ward_meta = WardMeta(
                     description=description, tags=tags, path=path,
                 )
+            unwrapped.ward_meta.signature = inspect.signature(unwrapped)
 
             collect_into = kwargs.get("_collect_into", anonymous_tests)
-            collect_into[path].append(unwrapped)
-
-            @functools.wraps(func)
-            def wrapper(*args, **kwargs):
-                return func(*args, **kwargs)
-
-            return wrapper
+            collect_into.setdefault(path, []).append(unwrapped)
 
         return func
 
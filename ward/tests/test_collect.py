@@ -52,6 +52,12 @@ def _(tests=tests_to_search, named=named_test):
     assert list(results) == [named]
 
 
+@test("filter_tests treats a query starting with '/' as a regular expression")
+def _(tests=tests_to_search, named=named_test):
+    results = filter_tests(tests, query="/f.x")
+    assert list(results) == [named]
+
+
 @test("filter_tests returns an empty generator when no tests match query")
 def _(tests=tests_to_search):
     results = filter_tests(tests, query="92qj3f9i")
@@ -59,6 +65,11 @@ def _(tests=tests_to_search):
         next(results)
 
 
+@test("filter_tests returns every test once when there's no query or tag expression")
+def _(tests=tests_to_search):
+    assert list(filter_tests(tests)) == tests
+
+
 @test("filter_tests when tags match simple tag expression")
 def _():
     apples = Test(fn=named, module_name="", tags=["apples"])
@@ -1,3 +1,5 @@
+import pickle
+
 from ward import test, each
 from ward.expect import (
     assert_not_equal,
@@ -12,6 +14,7 @@ from ward.expect import (
     assert_less_than_equal_to,
     assert_greater_than_equal_to,
     assert_greater_than,
+    Comparison,
 )
 
 
@@ -104,3 +107,24 @@ def _():
     raises_tb = traceback.extract_tb(ctx.raised.__traceback__)
 
     assert try_tb[1:] == raises_tb[1:]
+
+
+@test("TestFailure can be pickled and unpickled")
+def _():
+    failure = TestFailure(
+        "1 does not equal 2",
+        lhs=1,
+        rhs=2,
+        error_line=10,
+        operator=Comparison.Equals,
+        assert_msg="msg",
+    )
+    failure.error_line = 11
+
+    unpickled = pickle.loads(pickle.dumps(failure))
+
+    assert str(unpickled) == str(failure)
+    assert (unpickled.lhs, unpickled.rhs) == (1, 2)
+    assert unpickled.operator == Comparison.Equals
+    assert unpickled.assert_msg == "msg"
+    assert unpickled.error_line == 11
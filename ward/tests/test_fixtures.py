@@ -1,4 +1,6 @@
 from typing import List
+from unittest import mock
+import inspect
 import sys
 
 from ward.tests.utilities import testable_test
@@ -14,6 +16,7 @@ from ward import fixture, test, Scope, raises, each
 from ward.fixtures import Fixture, FixtureCache, using
 from ward.testing import Test
 from ward.errors import FixtureError
+from ward.models import WardMeta
 from ward.tests.utilities import dummy_fixture
 
 
@@ -166,6 +169,20 @@ def _(cache: FixtureCache = cache,):
     assert fixtures_at_scope == {}
 
 
+@test("FixtureCache.get_global_by_fn finds cached Global fixtures until teardown")
+def _(cache: FixtureCache = cache, global_fixture=global_fixture):
+    assert cache.get_global_by_fn(global_fixture).fn == global_fixture
+
+    cache.teardown_global_fixtures()
+
+    assert cache.get_global_by_fn(global_fixture) is None
+
+
+@test("FixtureCache.get_global_by_fn returns None for non-Global fixtures")
+def _(cache: FixtureCache = cache, module_fixture=module_fixture):
+    assert cache.get_global_by_fn(module_fixture) is None
+
+
 @test("FixtureCache.teardown_global_fixtures runs teardown of all Global fixtures")
 def _(cache: FixtureCache = cache, events: List = recorded_events):
     cache.teardown_global_fixtures()
@@ -173,6 +190,36 @@ def _(cache: FixtureCache = cache, events: List = recorded_events):
     assert events == ["teardown g"]
 
 
+@test("FixtureCache.teardown_fixtures_for_scope tears down every fixture if one raises")
+def _():
+    events = []
+
+    @fixture(scope=Scope.Global)
+    def g1():
+        yield
+        raise OSError("teardown failed")
+
+    @fixture(scope=Scope.Global)
+    def g2():
+        yield
+        events.append("teardown g2")
+
+    cache = FixtureCache()
+    for fn in (g1, g2):
+        f = Fixture(fn)
+        f.gen = fn()
+        next(f.gen)
+        cache.cache_fixture(f, Scope.Global)
+
+    with raises(FixtureError) as exc:
+        cache.teardown_global_fixtures()
+
+    assert str(exc.raised) == "Unable to tear down fixture 'g1'"
+    assert isinstance(exc.raised.__cause__, OSError)
+    assert events == ["teardown g2"]
+    assert cache.get_fixtures_at_scope(Scope.Global, Scope.Global) == {}
+
+
 @test("using decorator sets bound args correctly")
 def _():
     @fixture
@@ -202,6 +249,89 @@ def _(exit_code=each(0, 1)):
         t.resolver.resolve_args(FixtureCache())
 
 
+@test("resolving a fixture that's already cached returns the cached Fixture")
+def _():
+    calls = []
+
+    @fixture(scope=Scope.Module)
+    def f():
+        calls.append(1)
+        return "f"
+
+    @testable_test
+    def t(f=f):
+        pass
+
+    cache = FixtureCache()
+    first = Test(t, "").resolver._resolve_single_arg(f, cache)
+    second = Test(t, "").resolver._resolve_single_arg(f, cache)
+
+    assert first is second
+    assert calls == [1]
+
+
+@test("a fixture shared by several dependencies is resolved once, before them")
+def _():
+    events = []
+
+    @fixture
+    def shared():
+        events.append("shared")
+        return 1
+
+    @fixture
+    def a(s=shared):
+        events.append("a")
+        return s + 1
+
+    @fixture
+    def b(s=shared, a=a):
+        events.append("b")
+        return s + a
+
+    t = Test(fn=lambda a=a, b=b: None, module_name="foo")
+    resolved_args = t.resolver.resolve_args(FixtureCache())
+
+    assert resolved_args == {"a": 2, "b": 3}
+    assert events == ["shared", "a", "b"]
+
+
+@test("sibling fixtures are set up and torn down in declaration order")
+def _():
+    events = []
+
+    @fixture
+    def x():
+        events.append("setup x")
+        yield 1
+        events.append("teardown x")
+
+    @fixture
+    def y():
+        events.append("setup y")
+        yield 2
+        events.append("teardown y")
+
+    @fixture
+    def c(x=x, y=y):
+        events.append("setup c")
+        return x + y
+
+    t = Test(fn=lambda c=c: None, module_name="foo")
+    cache = FixtureCache()
+    resolved_args = t.resolver.resolve_args(cache)
+    cache.teardown_fixtures_for_scope(Scope.Test, t.id)
+
+    assert resolved_args == {"c": 3}
+    assert events == [
+        "setup x",
+        "setup y",
+        "setup c",
+        "teardown x",
+        "teardown y",
+    ]
+
+
 @test("is_fixture returns True for fixtures")
 def _():
     # I would have liked to combine this test into the parameterised test below,
@@ -215,6 +345,13 @@ def _(not_fixture=each("foo", 5, is_fixture, Fixture)):
     assert not is_fixture(not_fixture)
 
 
+@test("Fixture.line_number returns the line the fixture's definition starts on")
+def _():
+    expected = inspect.getsourcelines(dummy_fixture)[1]
+
+    assert Fixture(dummy_fixture).line_number == expected
+
+
 @test("Fixture.parents returns the parents of the fixture as Fixture instances")
 def _():
     @fixture
@@ -271,3 +408,32 @@ def _():
         fc: [fd],
         fd: [],
     }
+
+
+@test("@fixture captures the signature of the fixture on its WardMeta")
+def _():
+    @fixture
+    def a():
+        pass
+
+    @fixture
+    def b(a=a):
+        pass
+
+    assert b.ward_meta.signature == inspect.signature(b)
+    assert Fixture(b).deps() == b.ward_meta.signature.parameters
+
+
+@test("Fixture.deps and Test.deps share a single signature cache")
+def _():
+    def func(a=1):
+        pass
+
+    func.ward_meta = WardMeta(is_fixture=True)
+
+    with mock.patch.object(inspect, "signature", wraps=inspect.signature) as sig:
+        fixture_deps = Fixture(func).deps()
+        test_deps = Test(fn=func, module_name="foo").deps()
+
+    assert fixture_deps == test_deps
+    assert sig.call_count == 1
@@ -1,9 +1,12 @@
+import os
+from collections import defaultdict
+from pathlib import Path
 from unittest import mock
 
 from ward import fixture
-from ward.errors import ParameterisationError
+from ward.errors import FixtureError, ParameterisationError
 from ward.models import Scope, SkipMarker
-from ward.suite import Suite
+from ward.suite import Suite, _can_fork_workers
 from ward.testing import Test, skip, TestOutcome, TestResult, test, each
 from ward.tests.utilities import NUMBER_OF_TESTS, testable_test, example_test, module
 
@@ -476,3 +479,143 @@ def _():
         len(results) == 1 + 2
     )  # the first test doesn't expand, and the 2nd test expands into 2 tests
     assert type(results[0].error) == ParameterisationError
+
+
+def in_module(name):
+    """
+    Decorate a function with this to make it a test in the module at `name`.
+    """
+    return test(
+        "test in module", _force_path=Path(name), _collect_into=defaultdict(list),
+    )
+
+
+def skip_unless_workers(func):
+    if _can_fork_workers():
+        return func
+    return skip("worker processes can't be forked on this platform")(func)
+
+
+@test("Suite.generate_test_runs with workers runs each module's tests in a worker")
+def _():
+    @in_module("test_a")
+    def test_1(a=each(1, 2)):
+        assert a
+
+    @in_module("test_a")
+    def test_2():
+        assert 1 == 2
+
+    @in_module("test_b")
+    def test_3():
+        raise ZeroDivisionError
+
+    tests = [Test(fn=fn, module_name="") for fn in (test_1, test_2, test_3)]
+    suite = Suite(tests=tests)
+
+    results = list(suite.generate_test_runs(workers=2))
+    outcomes = {
+        (r.test.fn, r.test.param_meta.instance_index): r.outcome for r in results
+    }
+
+    assert len(results) == 4
+    assert outcomes == {
+        (test_1, 0): TestOutcome.PASS,
+        (test_1, 1): TestOutcome.PASS,
+        (test_2, 0): TestOutcome.FAIL,
+        (test_3, 0): TestOutcome.FAIL,
+    }
+    failure = next(r for r in results if r.test.fn is test_3)
+    assert isinstance(failure.error, ZeroDivisionError)
+
+
+@test("Suite.generate_test_runs reports fixture teardown errors as failures")
+def _():
+    @fixture(scope=Scope.Module)
+    def a():
+        yield 1
+        raise OSError("teardown failed")
+
+    @in_module("test_a")
+    def test_1(a=a):
+        assert a == 1
+
+    @in_module("test_b")
+    def test_2():
+        assert True
+
+    tests = [Test(fn=fn, module_name="") for fn in (test_1, test_2)]
+    for workers in (1, 2):
+        suite = Suite(tests=tests)
+        results = list(suite.generate_test_runs(workers=workers))
+        outcomes = sorted((r.test.fn.__name__, r.outcome.name) for r in results)
+
+        assert outcomes == [("test_1", "FAIL"), ("test_2", "PASS")]
+        failure = next(r for r in results if r.outcome == TestOutcome.FAIL)
+        assert isinstance(failure.error, FixtureError)
+        assert str(failure.error) == "Unable to tear down fixture 'a'"
+
+
+# Exiting from a test would end the whole run if it couldn't be given a worker
+@skip_unless_workers
+@test("Suite.generate_test_runs with workers reports a worker exiting as a failure")
+def _():
+    @in_module("test_a")
+    def test_1():
+        assert True
+
+    @in_module("test_a")
+    def test_2():
+        os._exit(7)
+
+    @in_module("test_a")
+    def test_3(a=each(1, 2)):
+        assert a
+
+    @in_module("test_b")
+    def test_4():
+        assert True
+
+    fns = (test_1, test_2, test_3, test_4)
+    tests = [Test(fn=fn, module_name="") for fn in fns]
+    suite = Suite(tests=tests)
+
+    results = list(suite.generate_test_runs(workers=2))
+    outcomes = {r.test.fn.__name__: (r.outcome, str(r.error)) for r in results}
+
+    assert len(results) == 4
+    assert outcomes == {
+        "test_1": (TestOutcome.PASS, "None"),
+        "test_2": (
+            TestOutcome.FAIL,
+            "Worker process exited unexpectedly with exit code 7",
+        ),
+        "test_3": (TestOutcome.FAIL, "Not run, because its worker process died"),
+        "test_4": (TestOutcome.PASS, "None"),
+    }
+    assert all(r.test.timer.duration is not None for r in results)
+
+
+@test("Suite.generate_test_runs with workers keeps apart tests sharing a function")
+def _():
+    @testable_test
+    def t():
+        assert True
+
+    first = Test(fn=t, module_name="", description="first")
+    second = Test(fn=t, module_name="", description="second")
+    suite = Suite(tests=[first, second])
+
+    results = list(suite.generate_test_runs(workers=2))
+
+    assert sorted(r.test.description for r in results) == ["first", "second"]
+    assert {id(r.test) for r in results} == {id(first), id(second)}
+
+
+@test("_can_fork_workers is False where fork isn't the default start method")
+def _():
+    with mock.patch(
+        "multiprocessing.get_all_start_methods",
+        return_value=["spawn", "fork", "forkserver"],
+    ):
+        assert not _can_fork_workers()
@@ -37,6 +37,17 @@ def _(example=example_test):
     assert exit_code == ExitCode.FAILED
 
 
+@test("get_exit_code returns ExitCode.FAILED when FAIL in a generator of results")
+def _(example=example_test):
+    test_results = (
+        TestResult(test=example, outcome=outcome)
+        for outcome in (TestOutcome.PASS, TestOutcome.FAIL)
+    )
+    exit_code = get_exit_code(test_results)
+
+    assert exit_code == ExitCode.FAILED
+
+
 @test("outcome_to_colour({outcome}) returns '{colour}'")
 def _(
     outcome=each(
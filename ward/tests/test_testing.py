@@ -1,4 +1,5 @@
 import asyncio
+import inspect
 from collections import defaultdict
 from pathlib import Path
 from unittest import mock
@@ -8,15 +9,17 @@ from ward.tests.utilities import FORCE_TEST_PATH, testable_test
 from ward import Scope, raises
 from ward.errors import ParameterisationError
 from ward.fixtures import FixtureCache, fixture, Fixture
-from ward.models import WardMeta
+from ward.models import SkipMarker, WardMeta, XfailMarker
 from ward.testing import (
     ParamMeta,
     TestOutcome,
     Test,
     each,
+    skip,
     test,
     xfail,
     fixtures_used_directly_by_tests,
+    _param_plan,
 )
 
 
@@ -68,6 +71,13 @@ def _(anonymous_test=anonymous_test):
     assert anonymous_test.qualified_name == f"{mod}._"
 
 
+@test("Test.line_number returns the line the test's definition starts on")
+def _(anonymous_test=anonymous_test):
+    expected = inspect.getsourcelines(anonymous_test.fn)[1]
+
+    assert anonymous_test.line_number == expected
+
+
 @test("Test.deps should return {} when test uses no fixtures")
 def _(anonymous_test=anonymous_test):
     assert anonymous_test.deps() == {}
@@ -79,6 +89,20 @@ def _(dependent_test=dependent_test):
     assert "a" in deps
 
 
+@test("Test.deps only inspects the signature of the wrapped function once")
+def _():
+    def func(a=1):
+        pass
+
+    with mock.patch.object(inspect, "signature", wraps=inspect.signature) as sig:
+        t = Test(fn=func, module_name=mod)
+        t.deps()
+        t.deps()
+        assert not t.is_parameterised
+
+    assert sig.call_count == 1
+
+
 @test("Test.has_deps should return True when test uses fixtures")
 def _(dependent_test=dependent_test):
     assert dependent_test.has_deps
@@ -167,6 +191,16 @@ def _():
     assert t.is_parameterised == True
 
 
+@test("Test.is_parameterised should return True for incorrectly parameterised test")
+def _():
+    def invalid_test(a=each(1, 2), b=each(3, 4, 5)):
+        pass
+
+    t = Test(fn=invalid_test, module_name=mod)
+
+    assert t.is_parameterised
+
+
 @test("Test.is_parameterised should return False for standard tests")
 def _():
     def test():
@@ -177,6 +211,14 @@ def _():
     assert not t.is_parameterised
 
 
+@test("Tests are given unique, hex-formatted IDs")
+def _():
+    ids = [Test(fn=f, module_name=mod).id for _ in range(3)]
+
+    assert len(set(ids)) == 3
+    assert all(len(id_) == 32 and int(id_, 16) >= 0 for id_ in ids)
+
+
 @test("Test.scope_key_from(Scope.Test) returns the test ID")
 def _(t: Test = anonymous_test):
     scope_key = t.scope_key_from(Scope.Test)
@@ -236,6 +278,37 @@ def _():
     ]
 
 
+@test("Test.get_parameterised_instances shares WardMeta but copies tags")
+def _():
+    def test(a=each(1, 2)):
+        pass
+
+    t = Test(fn=test, module_name=mod, tags=["slow"])
+    first, second = t.get_parameterised_instances()
+    first.tags.append("flaky")
+
+    assert first.ward_meta is second.ward_meta is t.ward_meta
+    assert first.tags == ["slow", "flaky"]
+    assert second.tags == t.tags == ["slow"]
+
+
+@test("_param_plan flags the `each` args that parameterised instances index into")
+def _(cache: FixtureCache = cache):
+    a = each(1, 2)
+
+    def test(a=a, b="b"):
+        pass
+
+    plan = _param_plan(test)
+    instances = Test(fn=test, module_name=mod).get_parameterised_instances()
+    resolved = [instance.resolver.resolve_args(cache) for instance in instances]
+
+    assert plan.defaults_items == (("a", a, True), ("b", "b", False))
+    assert plan.is_parameterised
+    assert plan.n_instances == 2
+    assert resolved == [{"a": 1, "b": "b"}, {"a": 2, "b": "b"}]
+
+
 @test("Test.get_parameterised_instances raises exception for arg count mismatch")
 def _():
     def invalid_test(a=each(1, 2), b=each(3, 4, 5)):
@@ -292,6 +365,34 @@ def _(func=example_test):
     )
 
 
+@test("@test captures the signature of the test function on its WardMeta")
+def _(func=example_test):
+    out_func = testable_test(func)
+
+    assert out_func.ward_meta.signature == inspect.signature(func)
+
+
+@test("@test, @skip and @xfail return the function they decorate")
+def _(func=example_test):
+    assert testable_test(func) is func
+    assert skip("reason")(func) is func
+    assert xfail("reason")(func) is func
+
+
+@test("@skip and @xfail attach the given reason to their marker")
+def _():
+    def a():
+        pass
+
+    def b():
+        pass
+
+    assert skip("positional")(a).ward_meta.marker == SkipMarker(reason="positional")
+    assert skip(reason="kw")(a).ward_meta.marker == SkipMarker(reason="kw")
+    assert xfail("positional")(b).ward_meta.marker == XfailMarker(reason="positional")
+    assert xfail(reason="kw")(b).ward_meta.marker == XfailMarker(reason="kw")
+
+
 @test("@test doesn't attach WardMeta to functions in non-test modules")
 def _(func=example_test):
     func.__module__ = "blah"
@@ -326,6 +427,15 @@ def _(func=example_test):
     assert dest[path.absolute()] == [func]
 
 
+@test("@test collects tests from the same module into a single list")
+def _(func=example_test):
+    dest = {}
+    path = Path("p")
+    test("test", _collect_into=dest, _force_path=path)(func)
+    test("test", _collect_into=dest, _force_path=path)(func)
+    assert dest == {path.absolute(): [func, func]}
+
+
 @test("@test doesn't collect items from non-test modules")
 def _(func=example_test):
     func.__module__ = "run"
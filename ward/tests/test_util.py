@@ -1,10 +1,13 @@
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import List
 
 from ward.tests.utilities import make_project
 from ward import test, using, fixture
 from ward.testing import each
 from ward.util import (
+    add_slots,
     truncate,
     find_project_root,
     group_by,
@@ -75,3 +78,19 @@ def _(
     ),
 ):
     assert group_by(items, key) == result
+
+
+@test("add_slots gives a dataclass slots for its fields, keeping defaults")
+def _():
+    @add_slots
+    @dataclass
+    class Point:
+        x: int
+        y: int = 0
+        tags: List[str] = field(default_factory=list)
+
+    point = Point(1)
+
+    assert Point.__slots__ == ("x", "y", "tags")
+    assert not hasattr(point, "__dict__")
+    assert point == Point(x=1, y=0, tags=[])
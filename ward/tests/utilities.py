@@ -78,7 +78,8 @@ def example_test(module=module, fixtures=fixtures):
 
 
 def make_project(root_file: str):
-    tempdir = Path(tempfile.gettempdir())
+    # A fresh directory each time, so that concurrent test runs don't collide
+    tempdir = Path(tempfile.mkdtemp())
     paths = [
         tempdir / "project/a/b/c",
         tempdir / "project/a/d",
@@ -90,4 +91,4 @@ def make_project(root_file: str):
     root_file = tempdir / f"project/{root_file}"
     with open(root_file, "w+", encoding="utf-8"):
         yield tempdir / "project"
-    shutil.rmtree(tempdir / "project")
+    shutil.rmtree(tempdir)
@@ -1,7 +1,8 @@
 import collections
+import dataclasses
 import inspect
 from pathlib import Path
-from typing import Iterable, Any, Callable, Hashable, TypeVar, Dict
+from typing import Iterable, Any, Callable, Hashable, TypeVar, Dict, Type
 
 
 def truncate(s: str, num_chars: int) -> str:
@@ -34,10 +35,37 @@ def get_absolute_path(object: Any) -> Path:
     return Path(inspect.getfile(object)).absolute()
 
 
+def get_line_number(fn: Callable) -> int:
+    # Equivalent to inspect.getsourcelines(fn)[1], without reading and
+    # tokenising the source file.
+    return inspect.unwrap(fn).__code__.co_firstlineno
+
+
 T = TypeVar("T")
 H = TypeVar("H", bound=Hashable)
 
 
+def add_slots(cls: Type[T]) -> Type[T]:
+    """
+    Recreate the dataclass `cls` with `__slots__` for each of its fields,
+    so instances don't carry a `__dict__`. This is equivalent to
+    `@dataclass(slots=True)`, which is only available from Python 3.10.
+
+    Must be applied on top of `@dataclass`.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    cls_dict["__slots__"] = field_names
+    for field_name in field_names:
+        # Remove the class attributes holding field defaults, which would
+        # otherwise clash with the slots. The defaults are already baked
+        # into the generated __init__.
+        cls_dict.pop(field_name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
 def group_by(items: Iterable[T], key: Callable[[T], H]) -> Dict[H, T]:
     groups = collections.defaultdict(list)
     for item in items: